@@ -6,6 +6,14 @@ from crash.arch import FetchRegistersCallback
 
 import gdb
 
+# (register, struct cpu_context field) pairs saved across a context switch
+_scheduled_regs = (
+    ('x19', 'x19'), ('x20', 'x20'), ('x21', 'x21'), ('x22', 'x22'),
+    ('x23', 'x23'), ('x24', 'x24'), ('x25', 'x25'), ('x26', 'x26'),
+    ('x27', 'x27'), ('x28', 'x28'), ('x29', 'fp'),
+    ('sp', 'sp'), ('pc', 'pc'),
+)
+
 class _FRC_inactive_task_frame(FetchRegistersCallback): # pylint: disable=abstract-method
     def fetch_active(self, thread: gdb.InferiorThread, register: int) -> None:
         task = thread.info
@@ -18,24 +26,13 @@ class _FRC_inactive_task_frame(FetchRegistersCallback): # pylint: disable=abstra
     def fetch_scheduled(self, thread: gdb.InferiorThread,
                         register: int) -> None:
         task = thread.info.task_struct
+        cpu_context = task['thread']['cpu_context']
+        registers = thread.registers
 
+        for reg, field in _scheduled_regs:
+            registers[reg].value = cpu_context[field]
 
-        thread.registers['x19'].value = task['thread']['cpu_context']['x19']
-        thread.registers['x20'].value = task['thread']['cpu_context']['x20']
-        thread.registers['x21'].value = task['thread']['cpu_context']['x21']
-        thread.registers['x22'].value = task['thread']['cpu_context']['x22']
-        thread.registers['x23'].value = task['thread']['cpu_context']['x23']
-        thread.registers['x24'].value = task['thread']['cpu_context']['x24']
-        thread.registers['x25'].value = task['thread']['cpu_context']['x25']
-        thread.registers['x26'].value = task['thread']['cpu_context']['x26']
-        thread.registers['x27'].value = task['thread']['cpu_context']['x27']
-        thread.registers['x28'].value = task['thread']['cpu_context']['x28']
-        thread.registers['x29'].value = task['thread']['cpu_context']['fp']
-
-        thread.registers['sp'].value = task['thread']['cpu_context']['sp']
-        thread.registers['pc'].value = task['thread']['cpu_context']['pc']
-
-        thread.info.stack_pointer = task['thread']['cpu_context']['sp']
+        thread.info.stack_pointer = cpu_context['sp']
         thread.info.valid_stack = True
 
 class Aarch64Architecture(CrashArchitecture):
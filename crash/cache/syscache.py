@@ -1,9 +1,8 @@
 # -*- coding: utf-8 -*-
 # vim:set shiftwidth=4 softtabstop=4 expandtab textwidth=79:
 
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 
-import re
 import zlib
 from datetime import timedelta
 
@@ -21,23 +20,25 @@ class CrashUtsnameCache(CrashCache):
     symvals = Symvals(['init_uts_ns'])
 
     def __init__(self) -> None:
-        self._utsname_cache_dict: Dict[str, str] = dict()
+        self._utsname_cache_dict: Optional[Dict[str, str]] = None
 
     @property
     def utsname(self) -> gdb.Value:
         return self.symvals.init_uts_ns['name']
 
-    def _init_utsname_cache(self) -> None:
-        d = self._utsname_cache_dict
+    def _init_utsname_cache(self) -> Dict[str, str]:
+        d = dict()
 
-        for field in self.utsname.type.fields():
-            val = self.utsname[field.name].string()
-            d[field.name] = val
+        utsname = self.utsname
+        for field in utsname.type.fields():
+            d[field.name] = utsname[field.name].string()
+
+        return d
 
     @property
     def _utsname_cache(self) -> Dict[str, str]:
-        if not self._utsname_cache_dict:
-            self._init_utsname_cache()
+        if self._utsname_cache_dict is None:
+            self._utsname_cache_dict = self._init_utsname_cache()
 
         return self._utsname_cache_dict
 
@@ -79,7 +80,7 @@ class CrashConfigCache(CrashCache):
 
     def __init__(self) -> None:
         self._config_buffer = ""
-        self._ikconfig_cache: Dict[str, str] = dict()
+        self._ikconfig_cache: Optional[Dict[str, str]] = None
 
     @property
     def config_buffer(self) -> str:
@@ -89,15 +90,12 @@ class CrashConfigCache(CrashCache):
 
     @property
     def ikconfig_cache(self) -> Dict[str, str]:
-        if not self._ikconfig_cache:
-            self._parse_config()
+        if self._ikconfig_cache is None:
+            self._ikconfig_cache = self._parse_config()
         return self._ikconfig_cache
 
     def __getitem__(self, name: str) -> Any:
-        try:
-            return self.ikconfig_cache[name]
-        except KeyError:
-            return None
+        return self.ikconfig_cache.get(name)
 
     @staticmethod
     def _read_buf_bytes(address: int, size: int) -> bytes:
@@ -133,19 +131,17 @@ class CrashConfigCache(CrashCache):
             },
         }
 
-    def _verify_image(self, location: ImageLocation) -> None:
+    def _verify_image(self, image: bytes) -> None:
         magic_start = b'IKCFG_ST'
         magic_end = b'IKCFG_ED'
 
-        buf_len = len(magic_start)
-        buf = self._read_buf_bytes(location['magic']['start'], buf_len)
+        buf = image[:len(magic_start)]
         if buf != magic_start:
             raise IOError(f"Missing magic_start in kernel_config_data. Got `{buf!r}'")
 
-        buf_len = len(magic_end)
-        buf = self._read_buf_bytes(location['magic']['end'], buf_len)
+        buf = image[-len(magic_end):]
         if buf != magic_end:
-            raise IOError("Missing magic_end in kernel_config_data. Got `{buf}'")
+            raise IOError(f"Missing magic_end in kernel_config_data. Got `{buf!r}'")
 
     def _decompress_config_buffer(self) -> str:
         try:
@@ -153,28 +149,37 @@ class CrashConfigCache(CrashCache):
         except DelayedAttributeError:
             location = self._locate_config_buffer_typed()
 
-        self._verify_image(location)
+        # The magic markers bracket the compressed data, so read the whole
+        # image in one go and slice it up locally.
+        start = location['magic']['start']
+        end = location['magic']['end'] + len(b'IKCFG_ED')
+        image = self._read_buf_bytes(start, end - start)
 
-        # Read the compressed data
-        buf = self._read_buf_bytes(location['data']['start'],
-                                   location['data']['size'])
+        self._verify_image(image)
+
+        offset = location['data']['start'] - start
+        buf = image[offset:offset + location['data']['size']]
 
         return zlib.decompress(buf, 16 + zlib.MAX_WBITS).decode('utf-8')
 
     def __str__(self) -> str:
         return self.config_buffer
 
-    def _parse_config(self) -> None:
+    def _parse_config(self) -> Dict[str, str]:
+        config: Dict[str, str] = dict()
+
         for line in self.config_buffer.splitlines():
             # bin comments
-            line = re.sub("#.*$", "", line).strip()
+            line = line.partition('#')[0].strip()
 
-            if not line:
+            if not line.startswith('CONFIG_'):
                 continue
 
-            m = re.match("CONFIG_([^=]*)=(.*)", line)
-            if m:
-                self._ikconfig_cache[m.group(1)] = m.group(2)
+            name, sep, value = line[7:].partition('=')
+            if sep:
+                config[name] = value
+
+        return config
 
 class CrashKernelCache(CrashCache):
     symvals = Symvals(['avenrun'])
@@ -250,23 +255,24 @@ class CrashKernelCache(CrashCache):
         cls._reset_uptime = True
 
     @classmethod
-    # pylint: disable=unused-argument
     def setup_jiffies(cls, symbol: gdb.Symbol) -> bool:
-        jiffies_sym = gdb.lookup_global_symbol('jiffies_64')
-
-        if jiffies_sym:
-            try:
-                jiffies = int(jiffies_sym.value())
-            except gdb.MemoryError:
-                return False
-            cls._adjust_jiffies = True
+        # This is registered for both jiffies and jiffies_64.  Use the
+        # symbol we're handed.  jiffies is only a fallback for kernels
+        # without jiffies_64; when jiffies_64 exists, its own callback
+        # sets the value, even if it isn't readable yet.
+        if symbol.name == 'jiffies_64':
+            adjust = True
+        elif gdb.lookup_global_symbol('jiffies_64') is not None:
+            return True
         else:
-            jiffies_sym = gdb.lookup_global_symbol('jiffies')
-            if not jiffies_sym:
-                return False
-            jiffies = int(jiffies_sym.value())
-            cls._adjust_jiffies = False
+            adjust = False
+
+        try:
+            jiffies = int(symbol.value())
+        except gdb.MemoryError:
+            return False
 
+        cls._adjust_jiffies = adjust
         cls.set_jiffies(jiffies)
 
         return True
@@ -276,8 +282,8 @@ class CrashKernelCache(CrashCache):
             return self.jiffies -(int(0x100000000) - 300 * self.hz)
         return self.jiffies
 
-symbol_cbs = SymbolCallbacks([('jiffies', CrashKernelCache.setup_jiffies),
-                              ('jiffies_64', CrashKernelCache.setup_jiffies)])
+symbol_cbs = SymbolCallbacks([('jiffies_64', CrashKernelCache.setup_jiffies),
+                              ('jiffies', CrashKernelCache.setup_jiffies)])
 
 utsname = CrashUtsnameCache()
 config = CrashConfigCache()
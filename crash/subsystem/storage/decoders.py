@@ -3,13 +3,33 @@
 
 from typing import Union, List, Dict, Iterable, Type, Any
 
-from crash.infra.lookup import SymbolCallback
+from functools import lru_cache
+
 from crash.subsystem.storage import block_device_name
+from crash.util.symbols import Types, SymbolCallbacks
 
 import gdb
 
 EndIOSpecifier = Union[int, str, List[str], gdb.Value, gdb.Symbol]
 
+types = Types(['struct block_device *'])
+
+@lru_cache(maxsize=1024)
+def _cached_block_device_name(address: int) -> str:
+    bdev = gdb.Value(address).cast(types.block_device_p_type)
+    return block_device_name(bdev)
+
+# pylint: disable=unused-argument
+def _flush_block_device_name_cache(event: gdb.NewObjFileEvent) -> None:
+    _cached_block_device_name.cache_clear()
+
+gdb.events.new_objfile.connect(_flush_block_device_name_cache)
+
+def _block_device_name(bdev: gdb.Value) -> str:
+    # Many bios in a queue or stack share a device, so avoid walking
+    # the gendisk for every one of them.
+    return _cached_block_device_name(int(bdev))
+
 class Decoder:
     """Decoder objects are used to unwind the storage stack
 
@@ -40,12 +60,19 @@ class Decoder:
         """
 
     def __getattr__(self, name: str) -> Any:
-        if self.interpreted:
+        # Private and special names are never produced by interpret(), so
+        # don't let probes for them trigger decoding.
+        if name.startswith('_') or self.interpreted:
             raise AttributeError(f"No such attribute `{name}'")
 
-        self.interpret()
         self.interpreted = True
-        return getattr(self, name)
+        try:
+            self.interpret()
+        except Exception:
+            self.interpreted = False
+            raise
+
+        return object.__getattribute__(self, name)
 
     @classmethod
     def register(cls) -> None:
@@ -136,7 +163,7 @@ class GenericBHDecoder(Decoder):
 
     def interpret(self) -> None:
         # pylint: disable=attribute-defined-outside-init
-        self.block_device = block_device_name(self.bh['b_bdev'])
+        self.block_device = _block_device_name(self.bh['b_bdev'])
 
     def __str__(self) -> str:
         return self._description.format(int(self.bh), self.block_device,
@@ -178,18 +205,14 @@ def register_decoder(endio: EndIOSpecifier, decoder: Type[Decoder]) -> None:
         decoder: The decoder class used to handle this object.
 
     """
-    debug = False
     if isinstance(endio, str):
-        if debug:
-            print(f"Registering {endio} as callback")
-        SymbolCallback(endio, lambda a: register_decoder(a, decoder))
-        return
+        endio = [endio]
 
     if isinstance(endio, list) and isinstance(endio[0], str):
-        for sym in endio:
-            if debug:
-                print(f"Registering {sym} as callback")
-            SymbolCallback(sym, lambda a: register_decoder(a, decoder))
+        def register(symbol: gdb.Symbol) -> None:
+            register_decoder(symbol, decoder)
+
+        SymbolCallbacks([(sym, register) for sym in endio])
         return
 
     if isinstance(endio, gdb.Symbol):
@@ -198,9 +221,6 @@ def register_decoder(endio: EndIOSpecifier, decoder: Type[Decoder]) -> None:
     if isinstance(endio, gdb.Value):
         endio = int(endio.address)
 
-    if debug:
-        print(f"Registering {endio:#x} for real")
-
     _decoders[endio] = decoder
 
 class BadBioDecoder(Decoder):
@@ -243,9 +263,12 @@ class GenericBioDecoder(Decoder):
         super().__init__()
         self.bio = bio
 
+    def interpret(self) -> None:
+        # pylint: disable=attribute-defined-outside-init
+        self.block_device = _block_device_name(self.bio['bi_bdev'])
+
     def __str__(self) -> str:
-        return self._description.format(int(self.bio),
-                                        block_device_name(self.bio['bi_bdev']),
+        return self._description.format(int(self.bio), self.block_device,
                                         self.bio['bi_end_io'])
 
 def decode_bio(bio: gdb.Value) -> Decoder:
@@ -267,9 +290,8 @@ def decode_bio(bio: gdb.Value) -> Decoder:
     """
 
     try:
-        return _decoders[int(bio['bi_end_io'])](bio)
-    except KeyError:
-        return GenericBioDecoder(bio)
+        decoder = _decoders.get(int(bio['bi_end_io']), GenericBioDecoder)
+        return decoder(bio)
     except gdb.NotAvailableError:
         return BadBioDecoder(bio)
 
@@ -293,9 +315,8 @@ def decode_bh(bh: gdb.Value) -> Decoder:
         :obj:`.Decoder`: The decoder appropriate for this buffer_head type
     """
     try:
-        return _decoders[int(bh['b_end_io'])](bh)
-    except KeyError:
-        return GenericBHDecoder(bh)
+        decoder = _decoders.get(int(bh['b_end_io']), GenericBHDecoder)
+        return decoder(bh)
     except gdb.NotAvailableError:
         return BadBHDecoder(bh)
 
@@ -318,7 +339,4 @@ def for_each_bio_in_stack(bio: gdb.Value) -> Iterable[Decoder]:
     decoder = decode_bio(bio)
     while decoder is not None:
         yield decoder
-        try:
-            decoder = next(decoder)
-        except StopIteration:
-            break
+        decoder = next(decoder)
@@ -30,12 +30,12 @@ class ClonedBioReqDecoder(Decoder):
     def __init__(self, bio: gdb.Value) -> None:
         super().__init__()
         self.bio = bio
-        if self._get_clone_bio_rq_info is None:
+        if not hasattr(self, '_get_clone_bio_rq_info'):
             if 'clone' in self._types.dm_rq_clone_bio_info_p_type.target():
-                getter = self._get_clone_bio_rq_info_3_7
+                getter = type(self)._get_clone_bio_rq_info_3_7
             else:
-                getter = self._get_clone_bio_rq_info_old
-            self._get_clone_bio_rq_info = getter
+                getter = type(self)._get_clone_bio_rq_info_old
+            type(self)._get_clone_bio_rq_info = getter
 
     def interpret(self) -> None:
         """Interprets the request-based device mapper bio to populate its
@@ -89,12 +89,12 @@ class ClonedBioDecoder(Decoder):
         super().__init__()
         self.bio = bio
 
-        if self._get_clone_bio_tio is None:
+        if not hasattr(self, '_get_clone_bio_tio'):
             if 'clone' in self._types.dm_target_io_p_type.target():
-                getter = self._get_clone_bio_tio_3_15
+                getter = type(self)._get_clone_bio_tio_3_15
             else:
-                getter = self._get_clone_bio_tio_old
-            self._get_clone_bio_tio = getter
+                getter = type(self)._get_clone_bio_tio_old
+            type(self)._get_clone_bio_tio = getter
 
     def interpret(self) -> None:
         """Interprets the cloned device mapper bio to populate its
@@ -65,18 +65,18 @@ def for_each_set_bit(bitmap: gdb.Value,
     idx = 0
     bit = 0
     while size > 0:
-        ulong = bitmap[idx]
-
-        if ulong != 0:
-            # pylint: disable=unused-variable
-            for off in range(min(size, bits_per_ulong)):
-                if ulong & 1 != 0:
-                    yield bit
-                bit += 1
-                ulong >>= 1
-        else:
-            bit += bits_per_ulong
-
+        # Convert the word once and do the bit scanning on Python ints
+        # rather than issuing gdb.Value operations for every bit.
+        ulong = int(bitmap[idx])
+        if size < bits_per_ulong:
+            ulong &= (1 << size) - 1
+
+        while ulong:
+            lsb = ulong & -ulong
+            yield bit + lsb.bit_length() - 1
+            ulong ^= lsb
+
+        bit += bits_per_ulong
         size -= bits_per_ulong
         idx += 1
 
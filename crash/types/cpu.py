@@ -4,7 +4,7 @@
 The crash.types.cpu module offers helpers to work with the state of CPUs.
 """
 
-from typing import Iterable, List
+from typing import Iterable, List, ClassVar
 
 from crash.util.symbols import SymbolCallbacks
 from crash.types.bitmap import for_each_set_bit
@@ -22,11 +22,11 @@ class TypesCPUClass:
         cpus_possible (:obj:`list` of :obj:`int`): A list of the IDs of all possible CPUs.
     """
 
-    cpus_online: List[int] = list()
-    cpus_possible: List[int] = list()
+    cpus_online: ClassVar[List[int]] = list()
+    cpus_possible: ClassVar[List[int]] = list()
 
-    _cpu_online_mask: gdb.Value
-    _cpu_possible_mask: gdb.Value
+    _cpu_online_mask: ClassVar[gdb.Value]
+    _cpu_possible_mask: ClassVar[gdb.Value]
 
     def __init__(self) -> None:
         raise NotImplementedError("This class is not meant to be instantiated")
@@ -65,13 +65,12 @@ class TypesCPUClass:
 
 def for_each_online_cpu() -> Iterable[int]:
     """
-    Yield CPU numbers of all online CPUs
+    Iterate over the CPU numbers of all online CPUs
 
-    Yields:
-        :obj:`int`: Number of an online CPU location
+    Returns:
+        :obj:`Iterable` of :obj:`int`: Numbers of the online CPUs
     """
-    for cpu in TypesCPUClass.cpus_online:
-        yield cpu
+    return iter(TypesCPUClass.cpus_online)
 
 def highest_online_cpu_nr() -> int:
     """
@@ -86,13 +85,12 @@ def highest_online_cpu_nr() -> int:
 
 def for_each_possible_cpu() -> Iterable[int]:
     """
-    Yield CPU numbers of all possible CPUs
+    Iterate over the CPU numbers of all possible CPUs
 
-    Yields:
-        :obj:`int`: Number of a possible CPU location
+    Returns:
+        :obj:`Iterable` of :obj:`int`: Numbers of the possible CPUs
     """
-    for cpu in TypesCPUClass.cpus_possible:
-        yield cpu
+    return iter(TypesCPUClass.cpus_possible)
 
 def highest_possible_cpu_nr() -> int:
     """
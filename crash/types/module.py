@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # vim:set shiftwidth=4 softtabstop=4 expandtab textwidth=79:
 
-from typing import Iterable, Tuple
+from typing import Iterable, Tuple, List, Optional
 
 from crash.types.list import list_for_each_entry
 from crash.util.symbols import Symvals, Types
@@ -9,20 +9,45 @@ from crash.util.symbols import Symvals, Types
 import gdb
 
 symvals = Symvals(['modules'])
-types = Types(['struct module'])
+types = Types(['struct module', 'struct module_sect_attr', 'char *'])
+
+_module_cache: Optional[List[gdb.Value]] = None
+_byteorder: Optional[str] = None
+
+# pylint: disable=unused-argument
+def _flush_module_cache(event: gdb.NewObjFileEvent) -> None:
+    global _module_cache, _byteorder # pylint: disable=global-statement
+    _module_cache = None
+    _byteorder = None
+
+gdb.events.new_objfile.connect(_flush_module_cache)
+
+def _target_byteorder() -> str:
+    global _byteorder # pylint: disable=global-statement
+    if _byteorder is None:
+        endian = gdb.execute("show endian", to_string=True)
+        _byteorder = 'big' if 'big endian' in endian else 'little'
+
+    return _byteorder
 
 def for_each_module() -> Iterable[gdb.Value]:
     """
     Iterate over each module in the modules list
 
-    Yields:
-        :obj:`gdb.Value`: The next module on the list.  The value is of
-        type ``struct module``.
+    The list is walked once and the result is reused until a new
+    objfile is loaded.
+
+    Returns:
+        :obj:`Iterable` of :obj:`gdb.Value`: The modules on the list.
+        Each value is of type ``struct module``.
 
     """
-    for module in list_for_each_entry(symvals.modules, types.module_type,
-                                      'list'):
-        yield module
+    global _module_cache # pylint: disable=global-statement
+    if _module_cache is None:
+        _module_cache = list(list_for_each_entry(symvals.modules,
+                                                 types.module_type, 'list'))
+
+    return iter(_module_cache)
 
 def for_each_module_section(module: gdb.Value) -> Iterable[Tuple[str, int]]:
     """
@@ -44,11 +69,37 @@ def for_each_module_section(module: gdb.Value) -> Iterable[Tuple[str, int]]:
         :obj:`gdb.NotAvailableError`: The target value is not available.
     """
     attrs = module['sect_attrs']
+    nsections = int(attrs['nsections'])
+    if nsections == 0:
+        return
+
+    # Read the whole attrs array in one go and decode the fields from the
+    # local copy rather than creating gdb values for each section.  This
+    # also avoids gdb's max-value-size limit on modules with many sections.
+    sect_attr_type = types.module_sect_attr_type
+    size = sect_attr_type.sizeof
+    name_field = sect_attr_type['name']
+    name_offset = name_field.bitpos // 8
+    name_size = name_field.type.sizeof
+    name_is_ptr = name_field.type.strip_typedefs().code == gdb.TYPE_CODE_PTR
+    addr_field = sect_attr_type['address']
+    addr_offset = addr_field.bitpos // 8
+    addr_size = addr_field.type.sizeof
+    byteorder = _target_byteorder()
+
+    start = int(attrs['attrs'].address)
+    inferior = gdb.selected_inferior()
+    buf = inferior.read_memory(start, nsections * size).tobytes()
 
-    for sec in range(0, attrs['nsections']):
-        attr = attrs['attrs'][sec]
-        name = attr['name'].string()
+    for offset in range(0, nsections * size, size):
+        raw_name = buf[offset + name_offset:offset + name_offset + name_size]
+        if name_is_ptr:
+            ptr = int.from_bytes(raw_name, byteorder)
+            name = gdb.Value(ptr).cast(types.char_p_type).string()
+        else:
+            name = raw_name.split(b'\0', 1)[0].decode()
         if name == '.text':
             continue
 
-        yield (name, int(attr['address']))
+        addr = buf[offset + addr_offset:offset + addr_offset + addr_size]
+        yield (name, int.from_bytes(addr, byteorder))
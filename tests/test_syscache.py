@@ -14,6 +14,9 @@ fake_config = (
 #
 CONFIG_HZ=250
 # CONFIG_HZ_1000 is not set
+CONFIG_LOCALVERSION="-default" # trailing comment
+CONFIG_CMDLINE="root=/dev/sda1 quiet"
+CONFIG_FOO
 #
 
 """)
@@ -90,6 +93,14 @@ class TestSysCache(unittest.TestCase):
         config = self.get_fake_config()
         self.assertTrue(config['HZ'] == '250')
 
+    def test_config_parse(self):
+        config = self.get_fake_config()
+        self.assertTrue(config.ikconfig_cache == {
+            'HZ' : '250',
+            'LOCALVERSION' : '"-default"',
+            'CMDLINE' : '"root=/dev/sda1 quiet"',
+        })
+
     def test_config_namespace(self):
         self.cycle_namespace()
         config = self.config
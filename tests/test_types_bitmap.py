@@ -92,6 +92,16 @@ class TestBitmap(unittest.TestCase):
 
         self.assertTrue(count == 24)
 
+    def test_for_each_set_bit_positions(self):
+        bits = list(bm.for_each_set_bit(self.bitmap))
+        self.assertTrue(bits == [1, 4, 7, 9, 12, 14, 18, 22, 25, 27, 31, 34,
+                                 36, 38, 42, 44, 46, 48, 51, 53, 56, 58,
+                                 60, 62])
+
+    def test_for_each_set_bit_partial_word(self):
+        bits = list(bm.for_each_set_bit(self.bitmap, 2))
+        self.assertTrue(bits == [1, 4, 7, 9, 12, 14])
+
     def test_find_first_set_bit(self):
         bit = bm.find_first_set_bit(self.bitmap)
         self.assertTrue(bit == 2)